@@ -13,7 +13,8 @@ Notable fields included in the module:
     * jc
         - object whose fields are lazily-loaded Java Class instances.
 """
-from threading import Lock
+from functools import lru_cache
+from threading import Lock, Thread
 from typing import Any, Callable, Dict
 
 import imagej
@@ -37,6 +38,35 @@ minimum_versions = {
 }
 
 
+def _version_tuple(version: str):
+    """
+    Parses a plain dotted version into a tuple of ints,
+    or None if any segment is non-numeric (e.g. a -SNAPSHOT qualifier).
+    """
+    try:
+        return tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        return None
+
+
+def _is_version_at_least(version: str, min_version: str) -> bool:
+    """
+    Determines whether version is at least min_version.
+
+    Plain numeric versions are compared as int tuples; anything with a
+    qualifier falls back to scyjava's full comparison.
+    """
+    v = _version_tuple(version)
+    minimum = _version_tuple(min_version)
+    if v is not None and minimum is not None:
+        # Zero-pad so e.g. 2.0 == 2.0.0
+        length = max(len(v), len(minimum))
+        v += (0,) * (length - len(v))
+        minimum += (0,) * (length - len(minimum))
+        return v >= minimum
+    return is_version_at_least(version, min_version)
+
+
 # -- ImageJ API -- #
 
 
@@ -105,7 +135,7 @@ class ImageJInitializer(QThread):
         log_debug("Initializing ImageJ2")
 
         # determine whether imagej is already running
-        imagej_already_initialized: bool = hasattr(imagej, "gateway") and imagej.gateway
+        imagej_already_initialized = getattr(imagej, "gateway", None) is not None
 
         # -- CONFIGURATION -- #
 
@@ -135,8 +165,17 @@ class ImageJInitializer(QThread):
 
         # -- VALIDATION -- #
 
-        # Validate PyImageJ
-        self._validate_imagej()
+        # Validate PyImageJ on a background thread. The version lookups read
+        # jar manifests and POMs, which is slow and does not have to hold up
+        # startup; violations are reported through the standard
+        # startup-error callback once found.
+        def validate():
+            try:
+                self._validate_imagej()
+            except Exception as exc:
+                java_signals._startup_error.emit(exc)
+
+        Thread(target=validate, daemon=True, name="napari-imagej-validate").start()
 
         # HACK: Avoid FlatLaf with ImageJ2 Swing UI;
         # it doesn't work for reasons unknown.
@@ -169,6 +208,34 @@ class ImageJInitializer(QThread):
             # NB: The hack failed, but no worries, just try to keep going.
             print(jstacktrace(exc))
 
+        # Warm lazily computed caches in the background, so the first user
+        # interaction doesn't pay for them.
+        self._prewarm_caches()
+
+    def _prewarm_caches(self) -> None:
+        """
+        Resolves the jc classes and the type hint list on a daemon thread.
+        Both are cached on first use; forcing that first use here, while the
+        user isn't waiting on anything, moves the cost off the first search
+        or module run. Failures are ignored - anything that cannot warm here
+        will surface (or not) exactly as it would have lazily.
+        """
+
+        def prewarm():
+            for name in JavaClasses._CLASS_NAMES:
+                try:
+                    getattr(jc, name)
+                except Exception:
+                    pass
+            try:
+                from napari_imagej.types.type_hints import type_hints
+
+                type_hints()
+            except Exception:
+                pass
+
+        Thread(target=prewarm, daemon=True, name="napari-imagej-prewarm").start()
+
     def _update_imagej_settings(self) -> None:
         """
         Updates napari-imagej's settings to reflect an active ImageJ instance.
@@ -241,15 +308,18 @@ class ImageJInitializer(QThread):
             "org.scijava:scijava-search": jc.Searcher,
         }
         # Add additional minimum versions for legacy components
-        if ij().legacy and ij().legacy.isActive():
-            component_requirements["net.imagej:imagej-legacy"] = ij().legacy.getClass()
+        # NB self.ij, not ij() - this may run before startup completes.
+        if self.ij.legacy and self.ij.legacy.isActive():
+            component_requirements[
+                "net.imagej:imagej-legacy"
+            ] = self.ij.legacy.getClass()
 
         # Find versions that violate the minimum
         violations = []
         for component, cls in component_requirements.items():
             min_version = minimum_versions[component]
             component_version = get_version(cls)
-            if not is_version_at_least(component_version, min_version):
+            if not _is_version_at_least(component_version, min_version):
                 violations.append(
                     f"{component} : {min_version} (Installed: {component_version})"
                 )
@@ -314,501 +384,194 @@ initializer = ImageJInitializer()
 java_signals = ImageJ_Callbacks()
 
 
+@lru_cache(maxsize=None)
+def _jimport(class_name: str) -> JClass:
+    """jimport, with the resulting class proxy cached per class name.
+
+    scyjava's jimport performs a Java classloader lookup on every call;
+    the classes in jc are requested constantly, so we memoize them here.
+    """
+    return jimport(class_name)
+
+
 class JavaClasses(object):
-    def blocking_import(func: Callable[[], str]) -> Callable[[], JClass]:
+    class blocking_import:
         """
-        A decorator used to lazily evaluate a java import.
-        func is a function of a Python class that takes no arguments and
+        A descriptor used to lazily evaluate a java import.
+        Decorates a function of a Python class that takes no arguments and
         returns a string identifying a Java class by name.
 
-        Using that function, this decorator creates a property
-        that when called:
+        Using that function, this descriptor, when accessed:
         * Blocks until the ImageJ gateway has been created
         * Imports the class identified by the function
+        * Caches the class on the instance, so later accesses skip the
+          descriptor (and its JVM checks) entirely
         """
 
-        @property
-        def inner(self):
+        def __init__(self, func: Callable[[], str]):
+            self.func = func
+
+        def __set_name__(self, owner, name: str):
+            self.name = name
+
+        def __get__(self, obj, objtype=None) -> JClass:
+            if obj is None:
+                return self
             if not jvm_started():
                 raise Exception()
             try:
-                return jimport(func(self))
+                value = _jimport(self.func(obj))
             except TypeError:
-                return None
-
-        return inner
-
-    # Java Primitives
-
-    @blocking_import
-    def Boolean(self):
-        return "java.lang.Boolean"
-
-    @blocking_import
-    def Byte(self):
-        return "java.lang.Byte"
-
-    @blocking_import
-    def Class(self):
-        return "java.lang.Class"
-
-    @blocking_import
-    def Character(self):
-        return "java.lang.Character"
-
-    @blocking_import
-    def Double(self):
-        return "java.lang.Double"
-
-    @blocking_import
-    def Float(self):
-        return "java.lang.Float"
-
-    @blocking_import
-    def Integer(self):
-        return "java.lang.Integer"
-
-    @blocking_import
-    def Long(self):
-        return "java.lang.Long"
-
-    @blocking_import
-    def Number(self):
-        return "java.lang.Number"
-
-    @blocking_import
-    def Short(self):
-        return "java.lang.Short"
-
-    @blocking_import
-    def String(self):
-        return "java.lang.String"
-
-    # Java Array Primitives
-
-    @blocking_import
-    def Boolean_Arr(self):
-        return "[Z"
-
-    @blocking_import
-    def Byte_Arr(self):
-        return "[B"
-
-    @blocking_import
-    def Character_Arr(self):
-        return "[C"
-
-    @blocking_import
-    def Double_Arr(self):
-        return "[D"
-
-    @blocking_import
-    def Float_Arr(self):
-        return "[F"
-
-    @blocking_import
-    def Integer_Arr(self):
-        return "[I"
-
-    @blocking_import
-    def Long_Arr(self):
-        return "[J"
-
-    @blocking_import
-    def Short_Arr(self):
-        return "[S"
-
-    # Vanilla Java Classes
-
-    @blocking_import
-    def ArrayList(self):
-        return "java.util.ArrayList"
-
-    @blocking_import
-    def BigDecimal(self):
-        return "java.math.BigDecimal"
-
-    @blocking_import
-    def BigInteger(self):
-        return "java.math.BigInteger"
-
-    @blocking_import
-    def Date(self):
-        return "java.util.Date"
-
-    @blocking_import
-    def Enum(self):
-        return "java.lang.Enum"
-
-    @blocking_import
-    def File(self):
-        return "java.io.File"
-
-    @blocking_import
-    def HashMap(self):
-        return "java.util.HashMap"
-
-    @blocking_import
-    def Path(self):
-        return "java.nio.file.Path"
-
-    @blocking_import
-    def Window(self):
-        return "java.awt.Window"
-
-    # SciJava Types
-
-    @blocking_import
-    def DisplayPostprocessor(self):
-        return "org.scijava.display.DisplayPostprocessor"
-
-    @blocking_import
-    def FileWidget(self):
-        return "org.scijava.widget.FileWidget"
-
-    @blocking_import
-    def InputHarvester(self):
-        return "org.scijava.widget.InputHarvester"
-
-    @blocking_import
-    def Module(self):
-        return "org.scijava.module.Module"
-
-    @blocking_import
-    def ModuleEvent(self):
-        return "org.scijava.module.event.ModuleEvent"
-
-    @blocking_import
-    def ModuleExecutedEvent(self):
-        return "org.scijava.module.event.ModuleExecutedEvent"
-
-    @blocking_import
-    def ModuleExecutingEvent(self):
-        return "org.scijava.module.event.ModuleExecutingEvent"
-
-    @blocking_import
-    def ModuleFinishedEvent(self):
-        return "org.scijava.module.event.ModuleFinishedEvent"
-
-    @blocking_import
-    def ModuleInfo(self):
-        return "org.scijava.module.ModuleInfo"
-
-    @blocking_import
-    def ModuleItem(self):
-        return "org.scijava.module.ModuleItem"
-
-    @blocking_import
-    def ModuleStartedEvent(self):
-        return "org.scijava.module.event.ModuleStartedEvent"
-
-    @blocking_import
-    def PostprocessorPlugin(self):
-        return "org.scijava.module.process.PostprocessorPlugin"
-
-    @blocking_import
-    def PreprocessorPlugin(self):
-        return "org.scijava.module.process.PreprocessorPlugin"
-
-    @blocking_import
-    def ResultsPostprocessor(self):
-        return "org.scijava.table.process.ResultsPostprocessor"
-
-    @blocking_import
-    def SciJavaEvent(self):
-        return "org.scijava.event.SciJavaEvent"
-
-    @blocking_import
-    def Searcher(self):
-        return "org.scijava.search.Searcher"
-
-    @blocking_import
-    def SearchEvent(self):
-        return "org.scijava.search.SearchEvent"
-
-    @blocking_import
-    def SearchListener(self):
-        return "org.scijava.search.SearchListener"
-
-    @blocking_import
-    def SearchResult(self):
-        return "org.scijava.search.SearchResult"
-
-    @blocking_import
-    def Table(self):
-        return "org.scijava.table.Table"
-
-    @blocking_import
-    def Types(self):
-        return "org.scijava.util.Types"
-
-    @blocking_import
-    def UIComponent(self):
-        return "org.scijava.widget.UIComponent"
-
-    @blocking_import
-    def UIShownEvent(self):
-        return "org.scijava.ui.event.UIShownEvent"
-
-    @blocking_import
-    def UserInterface(self):
-        return "org.scijava.ui.UserInterface"
-
-    # ImageJ Legacy Types
-
-    @blocking_import
-    def LegacyCommandInfo(self):
-        return "net.imagej.legacy.command.LegacyCommandInfo"
-
-    # ImgLib2 Types
-
-    @blocking_import
-    def BitType(self):
-        return "net.imglib2.type.logic.BitType"
-
-    @blocking_import
-    def BooleanType(self):
-        return "net.imglib2.type.BooleanType"
-
-    @blocking_import
-    def ColorTable(self):
-        return "net.imglib2.display.ColorTable"
-
-    @blocking_import
-    def ColorTable8(self):
-        return "net.imglib2.display.ColorTable8"
-
-    @blocking_import
-    def ColorTables(self):
-        return "net.imagej.display.ColorTables"
-
-    @blocking_import
-    def ComplexType(self):
-        return "net.imglib2.type.numeric.ComplexType"
-
-    @blocking_import
-    def DoubleType(self):
-        return "net.imglib2.type.numeric.real.DoubleType"
-
-    @blocking_import
-    def Img(self):
-        return "net.imglib2.img.Img"
-
-    @blocking_import
-    def IntegerType(self):
-        return "net.imglib2.type.numeric.IntegerType"
-
-    @blocking_import
-    def IterableInterval(self):
-        return "net.imglib2.IterableInterval"
-
-    @blocking_import
-    def LongType(self):
-        return "net.imglib2.type.numeric.integer.LongType"
-
-    @blocking_import
-    def NumericType(self):
-        return "net.imglib2.type.numeric.NumericType"
-
-    @blocking_import
-    def OutOfBoundsFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsFactory"
-
-    @blocking_import
-    def OutOfBoundsBorderFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsBorderFactory"
-
-    @blocking_import
-    def OutOfBoundsMirrorExpWindowingFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsMirrorExpWindowingFactory"
-
-    @blocking_import
-    def OutOfBoundsMirrorFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsMirrorFactory"
-
-    @blocking_import
-    def OutOfBoundsPeriodicFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsPeriodicFactory"
-
-    @blocking_import
-    def OutOfBoundsRandomValueFactory(self):
-        return "net.imglib2.outofbounds.OutOfBoundsRandomValueFactory"
-
-    @blocking_import
-    def RandomAccessible(self):
-        return "net.imglib2.RandomAccessible"
-
-    @blocking_import
-    def RandomAccessibleInterval(self):
-        return "net.imglib2.RandomAccessibleInterval"
-
-    @blocking_import
-    def RealPoint(self):
-        return "net.imglib2.RealPoint"
-
-    @blocking_import
-    def RealType(self):
-        return "net.imglib2.type.numeric.RealType"
-
-    # ImgLib2-algorithm Types
-
-    @blocking_import
-    def CenteredRectangleShape(self):
-        return "net.imglib2.algorithm.neighborhood.CenteredRectangleShape"
-
-    @blocking_import
-    def DiamondShape(self):
-        return "net.imglib2.algorithm.neighborhood.DiamondShape"
-
-    @blocking_import
-    def DiamondTipsShape(self):
-        return "net.imglib2.algorithm.neighborhood.DiamondTipsShape"
-
-    @blocking_import
-    def HorizontalLineShape(self):
-        return "net.imglib2.algorithm.neighborhood.HorizontalLineShape"
-
-    @blocking_import
-    def HyperSphereShape(self):
-        return "net.imglib2.algorithm.neighborhood.HyperSphereShape"
-
-    @blocking_import
-    def PairOfPointsShape(self):
-        return "net.imglib2.algorithm.neighborhood.PairOfPointsShape"
-
-    @blocking_import
-    def PeriodicLineShape(self):
-        return "net.imglib2.algorithm.neighborhood.PeriodicLineShape"
-
-    @blocking_import
-    def RectangleShape(self):
-        return "net.imglib2.algorithm.neighborhood.RectangleShape"
-
-    @blocking_import
-    def Shape(self):
-        return "net.imglib2.algorithm.neighborhood.Shape"
-
-    # ImgLib2-roi Types
-
-    @blocking_import
-    def Box(self):
-        return "net.imglib2.roi.geom.real.Box"
-
-    @blocking_import
-    def ClosedWritableBox(self):
-        return "net.imglib2.roi.geom.real.ClosedWritableBox"
-
-    @blocking_import
-    def ClosedWritableEllipsoid(self):
-        return "net.imglib2.roi.geom.real.ClosedWritableEllipsoid"
-
-    @blocking_import
-    def ClosedWritablePolygon2D(self):
-        return "net.imglib2.roi.geom.real.ClosedWritablePolygon2D"
-
-    @blocking_import
-    def DefaultWritableLine(self):
-        return "net.imglib2.roi.geom.real.DefaultWritableLine"
-
-    @blocking_import
-    def DefaultWritablePolyline(self):
-        return "net.imglib2.roi.geom.real.DefaultWritablePolyline"
-
-    @blocking_import
-    def DefaultWritableRealPointCollection(self):
-        return "net.imglib2.roi.geom.real.DefaultWritableRealPointCollection"
-
-    @blocking_import
-    def ImgLabeling(self):
-        return "net.imglib2.roi.labeling.ImgLabeling"
-
-    @blocking_import
-    def Line(self):
-        return "net.imglib2.roi.geom.real.Line"
-
-    @blocking_import
-    def PointMask(self):
-        return "net.imglib2.roi.geom.real.PointMask"
-
-    @blocking_import
-    def Polygon2D(self):
-        return "net.imglib2.roi.geom.real.Polygon2D"
-
-    @blocking_import
-    def Polyline(self):
-        return "net.imglib2.roi.geom.real.Polyline"
-
-    @blocking_import
-    def RealPointCollection(self):
-        return "net.imglib2.roi.geom.real.RealPointCollection"
-
-    @blocking_import
-    def SuperEllipsoid(self):
-        return "net.imglib2.roi.geom.real.SuperEllipsoid"
-
-    # ImageJ2 Types
-
-    @blocking_import
-    def Axes(self):
-        return "net.imagej.axis.Axes"
-
-    @blocking_import
-    def Dataset(self):
-        return "net.imagej.Dataset"
-
-    @blocking_import
-    def DatasetView(self):
-        return "net.imagej.display.DatasetView"
-
-    @blocking_import
-    def DefaultROITree(self):
-        return "net.imagej.roi.DefaultROITree"
-
-    @blocking_import
-    def ImageDisplay(self):
-        return "net.imagej.display.ImageDisplay"
-
-    @blocking_import
-    def ImgPlus(self):
-        return "net.imagej.ImgPlus"
-
-    @blocking_import
-    def Mesh(self):
-        return "net.imagej.mesh.Mesh"
-
-    @blocking_import
-    def NaiveDoubleMesh(self):
-        return "net.imagej.mesh.naive.NaiveDoubleMesh"
-
-    @blocking_import
-    def ROITree(self):
-        return "net.imagej.roi.ROITree"
-
-    # ImageJ Types
-
-    @blocking_import
-    def ImagePlus(self):
-        return "ij.ImagePlus"
-
-    # ImageJ-Ops Types
-
-    @blocking_import
-    def Initializable(self):
-        return "net.imagej.ops.Initializable"
-
-    @blocking_import
-    def OpInfo(self):
-        return "net.imagej.ops.OpInfo"
-
-    @blocking_import
-    def OpSearcher(self):
-        return "net.imagej.ops.search.OpSearcher"
-
-    # Scifio-Labeling Types
-
-    @blocking_import
-    def LabelingIOService(self):
-        return "io.scif.labeling.LabelingIOService"
+                value = None
+            # NB as a non-data descriptor, this descriptor is shadowed by the
+            # instance attribute written here; the import runs at most once.
+            obj.__dict__[self.name] = value
+            return value
+
+    # Names of all the Java classes exposed through jc, resolved lazily
+    # (and cached) by __getattr__ below.
+    _CLASS_NAMES: Dict[str, str] = {
+        # Java Primitives
+        "Boolean": "java.lang.Boolean",
+        "Byte": "java.lang.Byte",
+        "Class": "java.lang.Class",
+        "Character": "java.lang.Character",
+        "Double": "java.lang.Double",
+        "Float": "java.lang.Float",
+        "Integer": "java.lang.Integer",
+        "Long": "java.lang.Long",
+        "Number": "java.lang.Number",
+        "Short": "java.lang.Short",
+        "String": "java.lang.String",
+        # Java Array Primitives
+        "Boolean_Arr": "[Z",
+        "Byte_Arr": "[B",
+        "Character_Arr": "[C",
+        "Double_Arr": "[D",
+        "Float_Arr": "[F",
+        "Integer_Arr": "[I",
+        "Long_Arr": "[J",
+        "Short_Arr": "[S",
+        # Vanilla Java Classes
+        "ArrayList": "java.util.ArrayList",
+        "BigDecimal": "java.math.BigDecimal",
+        "BigInteger": "java.math.BigInteger",
+        "Date": "java.util.Date",
+        "Enum": "java.lang.Enum",
+        "File": "java.io.File",
+        "HashMap": "java.util.HashMap",
+        "Path": "java.nio.file.Path",
+        "Window": "java.awt.Window",
+        # SciJava Types
+        "DisplayPostprocessor": "org.scijava.display.DisplayPostprocessor",
+        "FileWidget": "org.scijava.widget.FileWidget",
+        "InputHarvester": "org.scijava.widget.InputHarvester",
+        "Module": "org.scijava.module.Module",
+        "ModuleEvent": "org.scijava.module.event.ModuleEvent",
+        "ModuleExecutedEvent": "org.scijava.module.event.ModuleExecutedEvent",
+        "ModuleExecutingEvent": "org.scijava.module.event.ModuleExecutingEvent",
+        "ModuleFinishedEvent": "org.scijava.module.event.ModuleFinishedEvent",
+        "ModuleInfo": "org.scijava.module.ModuleInfo",
+        "ModuleItem": "org.scijava.module.ModuleItem",
+        "ModuleStartedEvent": "org.scijava.module.event.ModuleStartedEvent",
+        "PostprocessorPlugin": "org.scijava.module.process.PostprocessorPlugin",
+        "PreprocessorPlugin": "org.scijava.module.process.PreprocessorPlugin",
+        "ResultsPostprocessor": "org.scijava.table.process.ResultsPostprocessor",
+        "SciJavaEvent": "org.scijava.event.SciJavaEvent",
+        "Searcher": "org.scijava.search.Searcher",
+        "SearchEvent": "org.scijava.search.SearchEvent",
+        "SearchListener": "org.scijava.search.SearchListener",
+        "SearchResult": "org.scijava.search.SearchResult",
+        "Table": "org.scijava.table.Table",
+        "Types": "org.scijava.util.Types",
+        "UIComponent": "org.scijava.widget.UIComponent",
+        "UIShownEvent": "org.scijava.ui.event.UIShownEvent",
+        "UserInterface": "org.scijava.ui.UserInterface",
+        # ImageJ Legacy Types
+        "LegacyCommandInfo": "net.imagej.legacy.command.LegacyCommandInfo",
+        # ImgLib2 Types
+        "BitType": "net.imglib2.type.logic.BitType",
+        "BooleanType": "net.imglib2.type.BooleanType",
+        "ColorTable": "net.imglib2.display.ColorTable",
+        "ColorTable8": "net.imglib2.display.ColorTable8",
+        "ColorTables": "net.imagej.display.ColorTables",
+        "ComplexType": "net.imglib2.type.numeric.ComplexType",
+        "DoubleType": "net.imglib2.type.numeric.real.DoubleType",
+        "Img": "net.imglib2.img.Img",
+        "IntegerType": "net.imglib2.type.numeric.IntegerType",
+        "IterableInterval": "net.imglib2.IterableInterval",
+        "LongType": "net.imglib2.type.numeric.integer.LongType",
+        "NumericType": "net.imglib2.type.numeric.NumericType",
+        "OutOfBoundsFactory": "net.imglib2.outofbounds.OutOfBoundsFactory",
+        "OutOfBoundsBorderFactory": "net.imglib2.outofbounds.OutOfBoundsBorderFactory",
+        "OutOfBoundsMirrorExpWindowingFactory": "net.imglib2.outofbounds.OutOfBoundsMirrorExpWindowingFactory",  # noqa: E501
+        "OutOfBoundsMirrorFactory": "net.imglib2.outofbounds.OutOfBoundsMirrorFactory",
+        "OutOfBoundsPeriodicFactory": "net.imglib2.outofbounds.OutOfBoundsPeriodicFactory",  # noqa: E501
+        "OutOfBoundsRandomValueFactory": "net.imglib2.outofbounds.OutOfBoundsRandomValueFactory",  # noqa: E501
+        "RandomAccessible": "net.imglib2.RandomAccessible",
+        "RandomAccessibleInterval": "net.imglib2.RandomAccessibleInterval",
+        "RealPoint": "net.imglib2.RealPoint",
+        "RealType": "net.imglib2.type.numeric.RealType",
+        # ImgLib2-algorithm Types
+        "CenteredRectangleShape": "net.imglib2.algorithm.neighborhood.CenteredRectangleShape",  # noqa: E501
+        "DiamondShape": "net.imglib2.algorithm.neighborhood.DiamondShape",
+        "DiamondTipsShape": "net.imglib2.algorithm.neighborhood.DiamondTipsShape",
+        "HorizontalLineShape": "net.imglib2.algorithm.neighborhood.HorizontalLineShape",
+        "HyperSphereShape": "net.imglib2.algorithm.neighborhood.HyperSphereShape",
+        "PairOfPointsShape": "net.imglib2.algorithm.neighborhood.PairOfPointsShape",
+        "PeriodicLineShape": "net.imglib2.algorithm.neighborhood.PeriodicLineShape",
+        "RectangleShape": "net.imglib2.algorithm.neighborhood.RectangleShape",
+        "Shape": "net.imglib2.algorithm.neighborhood.Shape",
+        # ImgLib2-roi Types
+        "Box": "net.imglib2.roi.geom.real.Box",
+        "ClosedWritableBox": "net.imglib2.roi.geom.real.ClosedWritableBox",
+        "ClosedWritableEllipsoid": "net.imglib2.roi.geom.real.ClosedWritableEllipsoid",
+        "ClosedWritablePolygon2D": "net.imglib2.roi.geom.real.ClosedWritablePolygon2D",
+        "DefaultWritableLine": "net.imglib2.roi.geom.real.DefaultWritableLine",
+        "DefaultWritablePolyline": "net.imglib2.roi.geom.real.DefaultWritablePolyline",
+        "DefaultWritableRealPointCollection": "net.imglib2.roi.geom.real.DefaultWritableRealPointCollection",  # noqa: E501
+        "ImgLabeling": "net.imglib2.roi.labeling.ImgLabeling",
+        "Line": "net.imglib2.roi.geom.real.Line",
+        "PointMask": "net.imglib2.roi.geom.real.PointMask",
+        "Polygon2D": "net.imglib2.roi.geom.real.Polygon2D",
+        "Polyline": "net.imglib2.roi.geom.real.Polyline",
+        "RealPointCollection": "net.imglib2.roi.geom.real.RealPointCollection",
+        "SuperEllipsoid": "net.imglib2.roi.geom.real.SuperEllipsoid",
+        # ImageJ2 Types
+        "Axes": "net.imagej.axis.Axes",
+        "Dataset": "net.imagej.Dataset",
+        "DatasetView": "net.imagej.display.DatasetView",
+        "DefaultROITree": "net.imagej.roi.DefaultROITree",
+        "ImageDisplay": "net.imagej.display.ImageDisplay",
+        "ImgPlus": "net.imagej.ImgPlus",
+        "Mesh": "net.imagej.mesh.Mesh",
+        "NaiveDoubleMesh": "net.imagej.mesh.naive.NaiveDoubleMesh",
+        "ROITree": "net.imagej.roi.ROITree",
+        # ImageJ Types
+        "ImagePlus": "ij.ImagePlus",
+        # ImageJ-Ops Types
+        "Initializable": "net.imagej.ops.Initializable",
+        "OpInfo": "net.imagej.ops.OpInfo",
+        "OpSearcher": "net.imagej.ops.search.OpSearcher",
+        # Scifio-Labeling Types
+        "LabelingIOService": "io.scif.labeling.LabelingIOService",
+    }
+
+    def __getattr__(self, name: str) -> JClass:
+        try:
+            class_name = self._CLASS_NAMES[name]
+        except KeyError:
+            raise AttributeError(name)
+        if not jvm_started():
+            raise Exception()
+        try:
+            value = _jimport(class_name)
+        except TypeError:
+            value = None
+        # Cache like blocking_import does; __getattr__ only runs on
+        # lookup misses, so later accesses hit the instance dict.
+        self.__dict__[name] = value
+        return value
 
 
 jc = JavaClasses()
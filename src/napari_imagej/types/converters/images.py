@@ -23,14 +23,18 @@ from napari_imagej.types.converters import java_to_py_converter, py_to_java_conv
 )
 def _dataset_view_to_image(image: Any) -> Image:
     view = ij().convert().convert(image, jc.DatasetView)
+    # NB fetch the data and color tables once; each accessor is a Java call
+    data = view.getData()
     # Construct a dataset from the data
     kwargs = dict(
-        data=java_to_xarray(ij(), view.getData()),
-        name=view.getData().getName(),
+        data=java_to_xarray(ij(), data),
+        name=data.getName(),
     )
-    if view.getColorTables() and view.getColorTables().size() > 0:
-        if not jc.ColorTables.isGrayColorTable(view.getColorTables().get(0)):
-            kwargs["colormap"] = _color_table_to_colormap(view.getColorTables().get(0))
+    color_tables = view.getColorTables()
+    if color_tables and color_tables.size() > 0:
+        color_table = color_tables.get(0)
+        if not jc.ColorTables.isGrayColorTable(color_table):
+            kwargs["colormap"] = _color_table_to_colormap(color_table)
     return Image(**kwargs)
 
 
@@ -59,24 +63,21 @@ def _dataset_to_image(image: Any) -> Image:
 def _image_to_dataset(image: Image) -> "jc.Dataset":
     # Construct a dataset from the data
     dataset: "jc.Dataset" = ij().py.to_dataset(image.data)
-    # We need an "X" axis, or ImageJ2 doesn't know how to display the dataset
-    if dataset.dimensionIndex(jc.Axes.X) == -1:
-        # find the first "unknown" dimension
+    # We need "X" and "Y" axes, or ImageJ2 doesn't know how to display the
+    # dataset. Assign any missing ones to the first "unknown" dimensions,
+    # in one pass over the axes instead of one pass per missing axis.
+    missing = [
+        axis_type
+        for axis_type in (jc.Axes.X, jc.Axes.Y)
+        if dataset.dimensionIndex(axis_type) == -1
+    ]
+    if missing:
         for i in range(dataset.numDimensions()):
             axis = dataset.axis(i)
             if "dim" in axis.type().getLabel():
-                # and set it to "X"
-                axis.setType(jc.Axes.X)
-                break
-    # We need an "Y" axis, or ImageJ2 doesn't know how to display the dataset
-    if dataset.dimensionIndex(jc.Axes.Y) == -1:
-        # find the first "unknown" dimension
-        for i in range(dataset.numDimensions()):
-            axis = dataset.axis(i)
-            if "dim" in axis.type().getLabel():
-                # and set it to "Y"
-                axis.setType(jc.Axes.Y)
-                break
+                axis.setType(missing.pop(0))
+                if not missing:
+                    break
 
     # Add name
     dataset.setName(image.name)
@@ -12,9 +12,9 @@ from napari_imagej.types.converters import java_to_py_converter, py_to_java_conv
 
 
 def arr(coords):
-    arr = JArray(JDouble)(len(coords))
-    arr[:] = coords
-    return arr
+    # Passing a contiguous float64 buffer lets JPype fill the Java array
+    # with one bulk copy instead of converting element by element.
+    return JArray(JDouble)(np.ascontiguousarray(coords, dtype=np.float64))
 
 
 def realPoint_from(coords: np.ndarray):
@@ -28,13 +28,28 @@ def realPoint_from(coords: np.ndarray):
     return jc.RealPoint(arr(coords))
 
 
+def realPoints_from(points: np.ndarray) -> list:
+    """
+    Creates a list of RealPoints from a numpy [N, D] array of coordinates.
+    :param points: The [N, D] numpy array of coordinates
+    :return: a list of RealPoints
+    """
+    # Convert to a contiguous double buffer ONCE; each row is then itself
+    # contiguous, so every RealPoint is built with a single bulk copy.
+    # Hoisting the jc/JArray lookups keeps the loop body to the two
+    # constructor calls.
+    data = np.ascontiguousarray(points, dtype=np.float64)
+    RealPoint = jc.RealPoint
+    DoubleArr = JArray(JDouble)
+    return [RealPoint(DoubleArr(row)) for row in data]
+
+
 @py_to_java_converter(
     predicate=lambda obj: isinstance(obj, Points), priority=Priority.VERY_HIGH
 )
 def _points_to_realpointcollection(points: Points) -> "jc.RealPointCollection":
     """Converts a napari Points into an ImageJ2 RealPointCollection"""
-    pts = [realPoint_from(x) for x in points.data]
-    ptList = jc.ArrayList(pts)
+    ptList = jc.ArrayList(realPoints_from(points.data))
     return jc.DefaultWritableRealPointCollection(ptList)
 
 
@@ -45,13 +60,17 @@ def _points_to_realpointcollection(points: Points) -> "jc.RealPointCollection":
 def _realpointcollection_to_points(collection: "jc.RealPointCollection") -> Points:
     """Converts an ImageJ2 RealPointsCollection into a napari Points"""
     # data - collection.size() points, collection.numDimensions() values per point
-    data = np.zeros((collection.size(), collection.numDimensions()))
+    data = np.empty((collection.size(), collection.numDimensions()))
     # Create a temporary array to pass to each point
     # N.B. we cannot just write pt.localize(data[i, :]) as JPype does not know
     # whether to use the localize(double[]) method or the localize(float[]) method.
     # We thus have to make the decision ourselves using tmp_arr, a double[].
     tmp_arr_dims = int(collection.numDimensions())
     tmp_arr = JArray(JDouble)(tmp_arr_dims)
+    # NB assign from the JArray itself - each assignment acquires a fresh
+    # buffer and copies the row in bulk. A numpy view taken up front would
+    # be a stale snapshot: JNI may hand JPype a COPY of the elements, so
+    # later Java-side writes never appear in it.
     for i, pt in enumerate(collection.points()):
         pt.localize(tmp_arr)
         data[i, :] = tmp_arr
@@ -14,9 +14,9 @@ from napari_imagej.types.converters import java_to_py_converter, py_to_java_conv
 
 
 def arr(coords):
-    arr = JArray(JDouble)(len(coords))
-    arr[:] = coords
-    return arr
+    # Passing a contiguous float64 buffer lets JPype fill the Java array
+    # with one bulk copy instead of converting element by element.
+    return JArray(JDouble)(np.ascontiguousarray(coords, dtype=np.float64))
 
 
 def realPoint_from(coords: np.ndarray):
@@ -30,13 +30,35 @@ def realPoint_from(coords: np.ndarray):
     return jc.RealPoint(arr(coords))
 
 
+def realPoints_from(points: np.ndarray) -> list:
+    """
+    Creates a list of RealPoints from a numpy [N, D] array of coordinates.
+    :param points: The [N, D] numpy array of coordinates
+    :return: a list of RealPoints
+    """
+    # Convert to a contiguous double buffer ONCE; each row is then itself
+    # contiguous, so every RealPoint is built with a single bulk copy.
+    # Hoisting the jc/JArray lookups keeps the loop body to the two
+    # constructor calls.
+    data = np.ascontiguousarray(points, dtype=np.float64)
+    RealPoint = jc.RealPoint
+    DoubleArr = JArray(JDouble)
+    return [RealPoint(DoubleArr(row)) for row in data]
+
+
 def _polyshape_to_layer_data(mask):
     vertices = mask.vertices()
     num_dims = mask.numDimensions()
     arr = JArray(JDouble)(int(num_dims))
-    data = np.zeros((vertices.size(), num_dims))
-    for i in range(len(vertices)):
-        vertices.get(i).localize(arr)
+    data = np.empty((vertices.size(), num_dims))
+    # NB iterate the Java list directly; indexed get(i) calls cross the
+    # JNI boundary once per vertex on top of the localize call.
+    # NB assign from the JArray itself - each assignment acquires a fresh
+    # buffer and copies the row in bulk. A numpy view taken up front would
+    # be a stale snapshot: JNI may hand JPype a COPY of the elements, so
+    # later Java-side writes never appear in it.
+    for i, vertex in enumerate(vertices):
+        vertex.localize(arr)
         data[i, :] = arr
     return data
 
@@ -52,11 +74,14 @@ def _ellipse_data_to_mask(pts):
 
 def _ellipse_mask_to_data(mask):
     # Make data array
-    data = np.zeros((2, mask.numDimensions()))
+    data = np.empty((2, mask.numDimensions()))
     # Write center into the first column
     center = mask.center().positionAsDoubleArray()
-    data[0, :] = center[:]  # Slice needed for JArray
+    # NB frombuffer views the JArray directly - one bulk copy on assignment
+    data[0, :] = np.frombuffer(memoryview(center), dtype=np.float64)
     # Write radii into the second column
+    # NB SuperEllipsoid exposes no bulk accessor for its semi-axis lengths,
+    # so those must still be read one dimension at a time.
     for i in range(data.shape[1]):
         data[1, i] = mask.semiAxisLength(i)
     return data
@@ -90,24 +115,22 @@ def _is_axis_aligned(min: np.ndarray, max: np.ndarray, points: np.ndarray) -> bo
     :param points: The four corners of the rectangle
     :return: true iff the rectangle defined by points is axis-aligned.
     """
-    other = next(
-        filter(
-            lambda p2: not np.array_equal(min, p2) and not np.array_equal(max, p2),
-            points,
-        ),
-        None,
-    )
-    min_diff = other - min
-    return any(d == 0 for d in min_diff)
+    pts = np.asarray(points)
+    is_min = np.all(pts == min, axis=1)
+    is_max = np.all(pts == max, axis=1)
+    other = pts[~(is_min | is_max)][0]
+    return bool(np.any(other == min))
 
 
 def _rectangle_data_to_mask(points):
+    pts = np.asarray(points)
     # find rectangle min - closest point to origin
-    origin = np.array([0, 0])
-    distances = [np.linalg.norm(origin - pt) for pt in points]
+    # NB squared distances order identically to distances; skip the sqrt.
+    distances = np.einsum("ij,ij->i", pts, pts)
     min = points[np.argmin(distances)]
     # find rectangle max - farthest point from minimum
-    min_distances = [np.linalg.norm(min - pt) for pt in points]
+    diffs = pts - min
+    min_distances = np.einsum("ij,ij->i", diffs, diffs)
     max = points[np.argmax(min_distances)]
     # Return box if axis aligned
     if _is_axis_aligned(min, max, points):
@@ -120,9 +143,10 @@ def _rectangle_data_to_mask(points):
 def _rectangle_mask_to_data(mask):
     min = mask.minAsDoubleArray()
     max = mask.maxAsDoubleArray()
-    data = np.zeros((2, len(min)))
-    data[0, :] = min[:]  # Slice needed for JArray
-    data[1, :] = max[:]  # Slice needed for JArray
+    data = np.empty((2, len(min)))
+    # NB frombuffer views the JArrays directly - one bulk copy per assignment
+    data[0, :] = np.frombuffer(memoryview(min), dtype=np.float64)
+    data[1, :] = np.frombuffer(memoryview(max), dtype=np.float64)
     return data
 
 
@@ -139,8 +163,7 @@ def _rectangle_mask_to_layer(mask: "jc.Box") -> Shapes:
 
 
 def _polygon_data_to_mask(points):
-    pts = [realPoint_from(x) for x in points]
-    ptList = jc.ArrayList(pts)
+    ptList = jc.ArrayList(realPoints_from(points))
     return jc.ClosedWritablePolygon2D(ptList)
 
 
@@ -173,7 +196,9 @@ def _line_data_to_mask(points):
 def _line_mask_to_data(mask):
     num_dims = mask.numDimensions()
     arr = JArray(JDouble)(int(num_dims))
-    data = np.zeros((2, num_dims))
+    data = np.empty((2, num_dims))
+    # NB assign from the JArray itself, acquiring a fresh buffer per
+    # endpoint; a view taken before the localize calls could be stale.
     # First point
     mask.endpointOne().localize(arr)
     data[0, :] = arr
@@ -197,8 +222,7 @@ def _line_mask_to_layer(mask: "jc.Line") -> Shapes:
 
 
 def _path_data_to_mask(points):
-    pts = [realPoint_from(x) for x in points]
-    ptList = jc.ArrayList(pts)
+    ptList = jc.ArrayList(realPoints_from(points))
     return jc.DefaultWritablePolyline(ptList)
 
 
@@ -228,17 +252,22 @@ def _path_mask_to_layer(mask: "jc.Polyline") -> Shapes:
 def _roitree_to_layer(roitree: "jc.ROITree") -> Shapes:
     layer = Shapes()
     rois = [child.data() for child in roitree.children()]
+    # Resolve the dispatch table once, not once per ROI; each jc access
+    # and bound-method lookup costs a little, and trees can hold many ROIs.
+    # NB order matters: Polygon2D/Polyline are also RealMasks, so the more
+    # specific types must be checked first.
+    dispatch = (
+        (jc.SuperEllipsoid, layer.add_ellipses, _ellipse_mask_to_data),
+        (jc.Box, layer.add_rectangles, _rectangle_mask_to_data),
+        (jc.Polygon2D, layer.add_polygons, _polygon_mask_to_data),
+        (jc.Line, layer.add_lines, _line_mask_to_data),
+        (jc.Polyline, layer.add_paths, _path_mask_to_data),
+    )
     for roi in rois:
-        if isinstance(roi, jc.SuperEllipsoid):
-            layer.add_ellipses(_ellipse_mask_to_data(roi))
-        elif isinstance(roi, jc.Box):
-            layer.add_rectangles(_rectangle_mask_to_data(roi))
-        elif isinstance(roi, jc.Polygon2D):
-            layer.add_polygons(_polygon_mask_to_data(roi))
-        elif isinstance(roi, jc.Line):
-            layer.add_lines(_line_mask_to_data(roi))
-        elif isinstance(roi, jc.Polyline):
-            layer.add_paths(_path_mask_to_data(roi))
+        for mask_type, add_data, mask_to_data in dispatch:
+            if isinstance(roi, mask_type):
+                add_data(mask_to_data(roi))
+                break
         else:
             raise NotImplementedError(
                 f"Cannot convert {roi}: conversion not implemented!"
@@ -246,6 +275,17 @@ def _roitree_to_layer(roitree: "jc.ROITree") -> Shapes:
     return layer
 
 
+# Maps napari shape types onto their mask builders; a dict probe per shape
+# replaces the string comparison chain formerly run for every shape.
+_MASK_BUILDERS = {
+    "ellipse": _ellipse_data_to_mask,
+    "rectangle": _rectangle_data_to_mask,
+    "polygon": _polygon_data_to_mask,
+    "line": _line_data_to_mask,
+    "path": _path_data_to_mask,
+}
+
+
 @py_to_java_converter(
     predicate=lambda obj: isinstance(obj, Shapes), priority=Priority.VERY_HIGH
 )
@@ -253,21 +293,12 @@ def _layer_to_roitree(layer: Shapes) -> "jc.DefaultROITree":
     """Converts a Shapes layer to a RealMask or a list of them."""
     masks = jc.ArrayList()
     for pts, shape_type in zip(layer.data, layer.shape_type):
-        if shape_type == "ellipse":
-            shape = _ellipse_data_to_mask(pts)
-        elif shape_type == "rectangle":
-            shape = _rectangle_data_to_mask(pts)
-        elif shape_type == "polygon":
-            shape = _polygon_data_to_mask(pts)
-        elif shape_type == "line":
-            shape = _line_data_to_mask(pts)
-        elif shape_type == "path":
-            shape = _path_data_to_mask(pts)
-        else:
+        builder = _MASK_BUILDERS.get(shape_type)
+        if builder is None:
             raise NotImplementedError(
                 f"Shape type {shape_type} cannot yet be converted!"
             )
-        masks.add(shape)
+        masks.add(builder(pts))
     rois = jc.DefaultROITree()
     rois.addROIs(masks)
     return rois
@@ -16,7 +16,8 @@ Notable functions included in the module:
     * python_type_of()
         - determines an "equivalent" python type for a given SciJava ModuleItem
 """
-from typing import Callable, List, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from jpype import JObject
 from scyjava import Priority
@@ -25,11 +26,15 @@ from napari_imagej.java import ij, jc
 from napari_imagej.types.enum_likes import enum_like
 from napari_imagej.types.enums import py_enum_for
 from napari_imagej.types.type_hints import type_hints
-from napari_imagej.widgets.parameter_widgets import widget_supported_java_types
 
 # List of Module Item Converters, along with their priority
 _MODULE_ITEM_CONVERTERS: List[Tuple[Callable, int]] = []
 
+# The converters above, sorted by descending priority.
+# Computed lazily on first use, at which point the chain is frozen: all
+# downstream caches assume the converter set no longer changes.
+_SORTED_CONVERTERS: Optional[Tuple[Callable, ...]] = None
+
 
 def module_item_converter(
     priority: int = Priority.NORMAL,
@@ -43,27 +48,109 @@ def module_item_converter(
 
     def converter(func: Callable):
         """Registers the annotated function with its priority"""
+        # Once the chain has been used, cached hints assume a fixed set of
+        # converters; fail loudly instead of silently serving stale answers.
+        if _SORTED_CONVERTERS is not None:
+            raise RuntimeError(
+                "The module item converter chain is frozen; converters must "
+                "be registered at import time, before the first hint lookup."
+            )
         _MODULE_ITEM_CONVERTERS.append((func, priority))
         return func
 
     return converter
 
 
+# Cache of resolved hints, keyed on the facets of a ModuleItem that the
+# converters inspect. Many modules share parameter types, so after warmup
+# most type_hint_for calls are answered with one dict probe.
+_HINT_CACHE: Dict[Tuple, Any] = {}
+
+# Sentinel recording that hint resolution failed for a key; failures are
+# just as expensive to recompute as successes (the whole converter chain
+# runs), so they are cached too.
+_NO_HINT = object()
+
+
+def _sorted_converters() -> Tuple[Callable, ...]:
+    """Returns the registered converters, sorted by descending priority."""
+    global _SORTED_CONVERTERS
+    if _SORTED_CONVERTERS is None:
+        _SORTED_CONVERTERS = tuple(
+            conv
+            for conv, _ in sorted(
+                _MODULE_ITEM_CONVERTERS, reverse=True, key=lambda x: x[1]
+            )
+        )
+    return _SORTED_CONVERTERS
+
+
+class _CachingModuleItem:
+    """
+    A thin ModuleItem wrapper memoizing the accessors the converter chain
+    queries over and over. Every converter may ask for the item's type and
+    I/O direction; fetching each answer from Java once, up front, leaves the
+    chain with plain python attribute reads. All other attribute access
+    forwards to the wrapped item.
+    """
+
+    def __init__(self, item: "jc.ModuleItem"):
+        self._item = item
+        self._type = item.getType()
+        self._is_input = item.isInput()
+        self._is_output = item.isOutput()
+        self._is_required = item.isRequired()
+
+    def getType(self):
+        return self._type
+
+    def isInput(self) -> bool:
+        return self._is_input
+
+    def isOutput(self) -> bool:
+        return self._is_output
+
+    def isRequired(self) -> bool:
+        return self._is_required
+
+    def __getattr__(self, name: str):
+        return getattr(self._item, name)
+
+
 def type_hint_for(module_item: "jc.ModuleItem"):
     """Returns a python type hint for the passed Java ModuleItem."""
-    for converter, _ in sorted(
-        _MODULE_ITEM_CONVERTERS, reverse=True, key=lambda x: x[1]
-    ):
+    item = _CachingModuleItem(module_item)
+    key = (
+        item.getType(),
+        item.isInput(),
+        item.isOutput(),
+        item.isRequired(),
+    )
+    hint = _HINT_CACHE.get(key)
+    if hint is None:
+        try:
+            hint = _resolve_type_hint(item)
+        except ValueError:
+            hint = _NO_HINT
+        _HINT_CACHE[key] = hint
+    if hint is _NO_HINT:
+        raise ValueError(
+            (
+                f"Cannot determine python type hint of {module_item.getType()}. "
+                "Let us know about the failure at https://forum.image.sc, "
+                "or file an issue at https://github.com/imagej/napari-imagej!"
+            )
+        )
+    return hint
+
+
+def _resolve_type_hint(module_item: "jc.ModuleItem"):
+    """Runs the converter chain for module_item; see type_hint_for."""
+    for converter in _sorted_converters():
         converted = converter(module_item)
         if converted is not None:
             return converted
-    raise ValueError(
-        (
-            f"Cannot determine python type hint of {module_item.getType()}. "
-            "Let us know about the failure at https://forum.image.sc, "
-            "or file an issue at https://github.com/imagej/napari-imagej!"
-        )
-    )
+    raise ValueError
 
 
 def _optional_of(p_type: type, item: "jc.ModuleItem") -> type:
@@ -79,8 +166,13 @@ def enum_like_converter(item: "jc.ModuleItem"):
     For a PythonStandin to work, it MUST be a pure input.
     This is because the python type has no functionality, as it is just an Enum choice.
     """
+    # Probe the (python-side) standin registry first; most types have no
+    # standin, and a miss here skips the isInput/isOutput Java calls.
+    standin = enum_like(item.getType(), None)
+    if standin is None:
+        return None
     if item.isInput() and not item.isOutput():
-        return _optional_of(enum_like(item.getType(), None), item)
+        return _optional_of(standin, item)
 
 
 @module_item_converter(priority=Priority.HIGH)
@@ -101,6 +193,10 @@ def widget_enabled_java_types(item: "jc.ModuleItem"):
     This is sometimes done to expose object creation/usage when there ISN'T
     a good Python equivalent.
     """
+    # Deferred - parameter_widgets pulls in napari/magicgui, which we don't
+    # want to pay for just by importing this module.
+    from napari_imagej.widgets.parameter_widgets import widget_supported_java_types
+
     if item.isInput() and not item.isOutput():
         if item.getType() in widget_supported_java_types():
             # TODO: NB: Ideally, we'd return item.getType() here.
@@ -111,6 +207,15 @@ def widget_enabled_java_types(item: "jc.ModuleItem"):
             return JObject
 
 
+# Cache for _checkerUsingFunc results.
+# The hint found by a checker depends only on the checking function and on the
+# type and I/O direction of the ModuleItem. The underlying Java queries
+# (e.g. isAssignableFrom, ConvertService.supports) are expensive JNI calls,
+# repeated for the same handful of types across every module we inspect;
+# caching ensures each distinct type pays that cost only once.
+_CHECKER_CACHE: Dict[Tuple, Any] = {}
+
+
 def _checkerUsingFunc(
     item: "jc.ModuleItem", func: Callable[[Type, Type], bool]
 ) -> Optional[Type]:
@@ -140,43 +245,140 @@ def _checkerUsingFunc(
     """
     # Get the type of the Module item
     java_type = item.getType()
+    key = (func, java_type, item.isInput(), item.isOutput())
+    if key in _CHECKER_CACHE:
+        hint = _CHECKER_CACHE[key]
+    else:
+        hint = _hintUsingFunc(java_type, item.isInput(), item.isOutput(), func)
+        _CHECKER_CACHE[key] = hint
+    if hint is None:
+        return None
+    return _optional_of(hint, item)
+
+
+def _hintUsingFunc(
+    java_type, is_input: bool, is_output: bool, func: Callable[[Type, Type], bool]
+) -> Optional[Type]:
+    """Finds a hint for java_type using func; see _checkerUsingFunc for the logic."""
     # Case 1
-    if item.isInput() and not item.isOutput():
+    if is_input and not is_output:
         for hint in type_hints():
             # can we go from hint.type to java_type?
             if func(hint.type, java_type):
-                return _optional_of(hint.hint, item)
+                return hint.hint
     # Case 2
-    elif item.isOutput() and not item.isInput():
+    elif is_output and not is_input:
         # NB type_pairs is ordered from least to most specific.
         for hint in type_hints():
             # can we go from java_type to hint.type?
             if func(java_type, hint.type):
-                return _optional_of(hint.hint, item)
+                return hint.hint
     # Case 3
-    elif item.isInput() and item.isOutput():
+    elif is_input and is_output:
         for hint in type_hints():
             # can we go both ways?
             if func(hint.type, java_type) and func(java_type, hint.type):
-                return _optional_of(hint.hint, item)
+                return hint.hint
 
     # Didn't satisfy any cases!
     return None
 
 
+# Lazily built index mapping raw Java types onto their python hints.
+# Exact-match lookups are by far the most common checker query, and a dict
+# probe replaces a linear scan of type_hints() full of JNI equals() calls.
+# NB isEqualChecker consults this index at HIGH priority, i.e. BEFORE the
+# isAssignableFrom/ConvertService scans run, so an exactly-known type never
+# pays for the slower checkers at all.
+_RAW_HINT_INDEX: Dict[Any, Type] = {}
+
+
+def _raw_hint_index() -> Dict[Any, Type]:
+    """Returns a map from raw Java type to python hint, built on first use."""
+    if not _RAW_HINT_INDEX:
+        for hint in type_hints():
+            # NB setdefault: on duplicate types, the first (highest-priority)
+            # hint wins, matching the scan order of _hintUsingFunc.
+            _RAW_HINT_INDEX.setdefault(_raw(hint.type), hint.hint)
+    return _RAW_HINT_INDEX
+
+
+@lru_cache(maxsize=None)
+def _raw(java_type):
+    """Types.raw(java_type), memoized - the raw type of a type never changes."""
+    return jc.Types.raw(java_type)
+
+
+def _isAssignable(from_type, to_type) -> bool:
+    # Use Types to get the raw type of each
+    return _raw(to_type).isAssignableFrom(_raw(from_type))
+
+
+# (raw Java type, python hint) pairs, in type_hints() priority order.
+# Pre-rawing the hint types once spares the assignability scan a _raw
+# lookup per hint per query.
+_RAW_HINT_PAIRS: Optional[Tuple[Tuple[Any, Type], ...]] = None
+
+
+def _raw_hint_pairs() -> Tuple[Tuple[Any, Type], ...]:
+    """Returns (raw type, hint) pairs, built on first use."""
+    global _RAW_HINT_PAIRS
+    if _RAW_HINT_PAIRS is None:
+        _RAW_HINT_PAIRS = tuple((_raw(hint.type), hint.hint) for hint in type_hints())
+    return _RAW_HINT_PAIRS
+
+
+def _assignableHint(java_type, is_input: bool, is_output: bool) -> Optional[Type]:
+    """Finds a hint raw-assignable to/from java_type; mirrors _hintUsingFunc."""
+    raw_type = _raw(java_type)
+    pairs = _raw_hint_pairs()
+    # Case 1
+    if is_input and not is_output:
+        for hint_raw, hint in pairs:
+            # can we go from hint.type to java_type?
+            if raw_type.isAssignableFrom(hint_raw):
+                return hint
+    # Case 2
+    elif is_output and not is_input:
+        for hint_raw, hint in pairs:
+            # can we go from java_type to hint.type?
+            if hint_raw.isAssignableFrom(raw_type):
+                return hint
+    # Case 3
+    elif is_input and is_output:
+        for hint_raw, hint in pairs:
+            # can we go both ways?
+            if raw_type.isAssignableFrom(hint_raw) and hint_raw.isAssignableFrom(
+                raw_type
+            ):
+                return hint
+
+    # Didn't satisfy any cases!
+    return None
+
+
+def _canConvert(from_type, to_type) -> bool:
+    # Assignable types are trivially convertible (the ConvertService's cast
+    # converter handles them), and the raw-assignability probe works off
+    # memoized raw types - so try it before the full supports() query.
+    if _isAssignable(from_type, to_type):
+        return True
+    return ij().convert().supports(from_type, to_type)
+
+
 @module_item_converter(priority=Priority.HIGH)
 def isEqualChecker(item: "jc.ModuleItem") -> Optional[Type]:
     """
     Determines whether we have a type hint for this SPECIFIC type.
     """
-
-    def isAssignable(from_type, to_type) -> bool:
-        # Use Types to get the raw type of each
-        from_raw = jc.Types.raw(from_type)
-        to_raw = jc.Types.raw(to_type)
-        return to_raw.equals(from_raw)
-
-    return _checkerUsingFunc(item, isAssignable)
+    # For exact matches, all three cases of _checkerUsingFunc collapse to a
+    # raw-type equality test, so a single index lookup suffices.
+    if not (item.isInput() or item.isOutput()):
+        return None
+    hint = _raw_hint_index().get(_raw(item.getType()))
+    if hint is None:
+        return None
+    return _optional_of(hint, item)
 
 
 @module_item_converter()
@@ -184,14 +386,16 @@ def isAssignableChecker(item: "jc.ModuleItem") -> Optional[Type]:
     """
     Determines whether we can simply cast from ptype to item's type java_type
     """
-
-    def isAssignable(from_type, to_type) -> bool:
-        # Use Types to get the raw type of each
-        from_raw = jc.Types.raw(from_type)
-        to_raw = jc.Types.raw(to_type)
-        return to_raw.isAssignableFrom(from_raw)
-
-    return _checkerUsingFunc(item, isAssignable)
+    java_type = item.getType()
+    key = (_assignableHint, java_type, item.isInput(), item.isOutput())
+    if key in _CHECKER_CACHE:
+        hint = _CHECKER_CACHE[key]
+    else:
+        hint = _assignableHint(java_type, item.isInput(), item.isOutput())
+        _CHECKER_CACHE[key] = hint
+    if hint is None:
+        return None
+    return _optional_of(hint, item)
 
 
 @module_item_converter(priority=Priority.LOW)
@@ -199,8 +403,4 @@ def canConvertChecker(item: "jc.ModuleItem") -> Optional[Type]:
     """
     Determines whether imagej can do a conversion from ptype to item's type java_type.
     """
-
-    def isAssignable(from_type, to_type) -> bool:
-        return ij().convert().supports(from_type, to_type)
-
-    return _checkerUsingFunc(item, isAssignable)
+    return _checkerUsingFunc(item, _canConvert)
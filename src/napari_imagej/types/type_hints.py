@@ -11,7 +11,7 @@ The hint maps are broken up into sub-maps for convenience and utility.
 """
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Callable, List, Union
+from typing import Callable, List, Tuple, Union
 
 from jpype import JBoolean, JByte, JChar, JDouble, JFloat, JInt, JLong, JShort
 from scyjava import Priority
@@ -43,16 +43,19 @@ def hint_category(func: Callable[[], List[TypeHint]]) -> Callable[[], List[TypeH
 
 
 @lru_cache(maxsize=None)
-def type_hints() -> List[TypeHint]:
+def type_hints() -> Tuple[TypeHint, ...]:
     """
-    Returns a List of all HARDCODED python type hints for java types,
+    Returns a Tuple of all HARDCODED python type hints for java types,
     sorted by priority.
+
+    NB a tuple - the object is cached and shared by every caller, so it
+    must not be (accidentally) mutable.
     """
     types: List[TypeHint] = []
     for generator in HINT_GENERATORS:
         types.extend(generator())
     types.sort(reverse=True, key=lambda hint: hint.priority)
-    return types
+    return tuple(types)
 
 
 @hint_category
@@ -25,7 +25,7 @@ from napari_imagej.java import ij, jc
 from napari_imagej.types.type_conversions import type_hint_for
 from napari_imagej.types.type_utils import type_displayable_in_napari
 from napari_imagej.types.widget_mappings import preferred_widget_for
-from napari_imagej.utilities.logging import log_debug
+from napari_imagej.utilities.logging import debugging, log_debug
 from napari_imagej.utilities.progress_manager import pm
 
 
@@ -194,7 +194,9 @@ def _param_default_or_none(input: "jc.ModuleItem") -> Optional[Any]:
         return default
 
 
-def _module_param(input: "jc.ModuleItem") -> Parameter:
+def _module_param(
+    input: "jc.ModuleItem", type_hint: Optional[Union[str, type]] = None
+) -> Parameter:
     """Converts a java ModuleItem into a python Parameter"""
     name = str(input.getName())
     if name == "in":
@@ -203,7 +205,8 @@ def _module_param(input: "jc.ModuleItem") -> Parameter:
         name = "input"
     kind = Parameter.POSITIONAL_OR_KEYWORD
     default = _param_default_or_none(input)
-    type_hint = type_hint_for(input)
+    if type_hint is None:
+        type_hint = type_hint_for(input)
 
     return Parameter(name=name, kind=kind, default=default, annotation=type_hint)
 
@@ -212,13 +215,20 @@ def _modify_function_signature(
     function: Callable,
     inputs: List["jc.ModuleItem"],
     module_info: "jc.ModuleInfo",
-) -> None:
-    """Rewrites function with type annotations for all module I/O items."""
+    type_hints: Optional[Dict[str, Union[str, type]]] = None,
+) -> Signature:
+    """Rewrites function with type annotations for all module I/O items.
+
+    :return: the rewritten Signature, for callers that need it; this avoids
+    a second (expensive) signature() introspection of function.
+    """
 
     sig: Signature = signature(function)
     # Grab all options after the module inputs
     inputs = _sink_optional_inputs(inputs)
-    module_params = [_module_param(i) for i in inputs]
+    if type_hints is None:
+        type_hints = {str(i.getName()): type_hint_for(i) for i in inputs}
+    module_params = [_module_param(i, type_hints.get(str(i.getName()))) for i in inputs]
     other_params = [
         Parameter(
             i[0],
@@ -230,6 +240,7 @@ def _modify_function_signature(
     ]
     all_params = module_params + other_params
     function.__signature__ = sig.replace(parameters=all_params)
+    return function.__signature__
 
 
 def _pure_module_outputs(
@@ -307,19 +318,24 @@ def _add_napari_metadata(
     info: "jc.ModuleInfo",
     unresolved_inputs: List["jc.ModuleItem"],
 ) -> None:
-    module_name = ij().py.from_java(info.getTitle())
+    module_name = str(info.getTitle())
     execute_module.__doc__ = f"Invoke ImageJ2's {module_name}"
     execute_module.__name__ = module_name
     execute_module.__qualname__ = module_name
 
+    # Resolve the type hint of each input ONCE; hint determination can require
+    # expensive Java calls, so we reuse the results below.
+    type_hints = {str(i.getName()): type_hint_for(i) for i in unresolved_inputs}
+
     # Rewrite the function signature to match the module inputs.
-    _modify_function_signature(execute_module, unresolved_inputs, info)
+    sig = _modify_function_signature(
+        execute_module, unresolved_inputs, info, type_hints
+    )
 
     # Add the type hints as annotations metadata as well.
     # Without this, magicgui doesn't pick up on the types.
-    type_hints = {str(i.getName()): type_hint_for(i) for i in unresolved_inputs}
 
-    type_hints["return"] = signature(execute_module).return_annotation
+    type_hints["return"] = sig.return_annotation
 
     execute_module._info = info  # type: ignore
     execute_module.__annotation__ = type_hints  # type: ignore
@@ -357,7 +373,7 @@ def _add_scijava_metadata(
 ) -> Dict[str, Dict[str, Any]]:
     metadata = {}
     for input in unresolved_inputs:
-        key = ij().py.from_java(input.getName())
+        key = str(input.getName())
         param_map = {}
         _add_param_metadata(param_map, "max", input.getMaximumValue())
         _add_param_metadata(param_map, "min", input.getMinimumValue())
@@ -584,10 +600,11 @@ class NapariPostProcessor(object):
         widget_outputs: List[Any]
         layer_outputs, widget_outputs = _pure_module_outputs(module, self.params)
         # log outputs
-        for layer in layer_outputs:
-            log_debug(f"Result: ({type(layer).__name__}) {layer.name}")
-        for output in widget_outputs:
-            log_debug(f"Result: ({type(output[1])}) {output[0]}")
+        if debugging():
+            for layer in layer_outputs:
+                log_debug(f"Result: ({type(layer).__name__}) {layer.name}")
+            for output in widget_outputs:
+                log_debug(f"Result: ({type(output[1])}) {output[0]}")
 
         mutated_layers = _mutable_layers(
             self.params,
@@ -601,7 +618,7 @@ class NapariPostProcessor(object):
             "display_results_in_new_window",
         )
         if display_externally is not None and len(widget_outputs) > 0:
-            name = "Result: " + ij().py.from_java(module.getInfo().getTitle())
+            name = "Result: " + str(module.getInfo().getTitle())
             self.output_handler(
                 {"data": widget_outputs, "name": name, "external": display_externally}
             )
@@ -8,7 +8,6 @@ Notable functions included in the module:
 import logging
 
 _logger = logging.getLogger(__name__)
-_logger.setLevel(logging.DEBUG)  # TEMP
 
 
 # -- LOGGER API -- #
@@ -22,10 +21,19 @@ def logger() -> logging.Logger:
     return _logger
 
 
+def debugging() -> bool:
+    """
+    Determines whether debug logging is enabled.
+    Useful for guarding loops whose only purpose is to build debug messages.
+    :return: True iff debug messages will be emitted
+    """
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
 def log_debug(msg: str):
     """
     Provides a debug message to the logger, prefaced by 'napari-imagej: '
     :param msg: The message to output
     """
-    debug_msg = "napari-imagej: " + msg
-    _logger.debug(debug_msg)
+    if debugging():
+        _logger.debug("napari-imagej: " + msg)
@@ -1,17 +1,19 @@
 """
 The top-level menu for the napari-imagej widget.
 """
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from jpype import JImplements, JOverride
 from magicgui.widgets import request_values
 from napari import Viewer
-from napari._qt.qt_resources import QColoredSVGIcon
 from napari.layers import Layer
 from napari.utils._magicgui import get_layers
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtGui import QIcon, QPixmap
 from qtpy.QtWidgets import QHBoxLayout, QMessageBox, QPushButton, QWidget
 from scyjava import is_arraylike
@@ -19,6 +21,83 @@ from scyjava import is_arraylike
 from napari_imagej import settings
 from napari_imagej.java import ij, java_signals, jc
 from napari_imagej.resources import resource_path
+from napari_imagej.utilities.logging import logger
+from napari_imagej.widgets.widget_utils import java_event_bus
+
+# Work items awaiting execution on the EDT (the Java UI thread).
+# Each ij().thread().queue() call crosses the JPype boundary and schedules
+# its own EDT work item; batching pending callables here and draining them
+# with ONE queued Runnable keeps a burst of UI actions to a single crossing.
+_edt_queue: deque = deque()
+_edt_lock = Lock()
+_drain_scheduled = False
+
+
+def _drain_edt_queue():
+    """Runs all pending work items in order. Runs ON the EDT."""
+    global _drain_scheduled
+    while True:
+        with _edt_lock:
+            if not _edt_queue:
+                _drain_scheduled = False
+                return
+            fn = _edt_queue.popleft()
+        try:
+            fn()
+        except Exception:
+            # NB one failed work item must not end the drain; an escaping
+            # exception would leave _drain_scheduled set with no drain
+            # pending, silently dropping all later EDT dispatch.
+            logger().exception("napari-imagej: EDT work item failed")
+
+
+def _queue_on_edt(fn: Callable[[], None]):
+    """Schedules fn to run on the EDT."""
+    global _drain_scheduled
+    with _edt_lock:
+        _edt_queue.append(fn)
+        if _drain_scheduled:
+            return
+        _drain_scheduled = True
+    ij().thread().queue(_drain_edt_queue)
+
+
+@lru_cache(maxsize=32)
+def _icon_from(path: str) -> QIcon:
+    """Loads (and caches) the icon at path; buttons swap icons repeatedly."""
+    return QIcon(QPixmap(path))
+
+
+@lru_cache(maxsize=16)
+def _themed_icon(name: str, theme: str) -> QIcon:
+    """Colors (and caches) the named napari SVG icon for the given theme."""
+    # NB deferred import - napari's Qt resources are expensive to load
+    from napari._qt.qt_resources import QColoredSVGIcon
+
+    return QColoredSVGIcon.from_resources(name).colored(theme=theme)
+
+
+@lru_cache(maxsize=16)
+def _themed_resource_icon(path: str, theme: str) -> QIcon:
+    """Colors (and caches) the SVG icon at path for the given theme."""
+    # NB deferred import - napari's Qt resources are expensive to load
+    from napari._qt.qt_resources import QColoredSVGIcon
+
+    return QColoredSVGIcon(path).colored(theme=theme)
+
+
+# The popup warning that there was nothing to transfer, reused across shows
+_no_choices_popup: Optional["RichTextPopup"] = None
+
+
+def _handle_no_choices(rich_message: str):
+    """Warns the user, via a popup, that there was nothing to transfer"""
+    global _no_choices_popup
+    if _no_choices_popup is None:
+        _no_choices_popup = RichTextPopup(rich_message=rich_message)
+    else:
+        _no_choices_popup.setText(rich_message)
+    _no_choices_popup.exec()
 
 
 class NapariImageJMenu(QWidget):
@@ -39,39 +118,37 @@ class NapariImageJMenu(QWidget):
         self.settings_button: SettingsButton = SettingsButton(viewer)
         self.layout().addWidget(self.settings_button)
 
-        if settings["jvm_mode"].get(str) == "headless":
+        headless = settings["jvm_mode"].get(str) == "headless"
+        if headless:
             self.gui_button.clicked.connect(self.gui_button.disable_popup)
         else:
             # NB We need to call ij().ui().showUI() on the GUI thread.
             # TODO: Use PyImageJ functionality
             # see https://github.com/imagej/pyimagej/pull/260
             def show_ui():
-                if ij().ui().isVisible():
-                    ij().thread().queue(
-                        lambda: ij()
-                        .ui()
-                        .getDefaultUI()
-                        .getApplicationFrame()
-                        .setVisible(True)
+                ui = ij().ui()
+                if ui.isVisible():
+                    _queue_on_edt(
+                        lambda: ui.getDefaultUI().getApplicationFrame().setVisible(True)
                     )
                 else:
-                    ij().thread().queue(lambda: ij().ui().showUI())
+                    _queue_on_edt(ui.showUI)
 
             self.gui_button.clicked.connect(show_ui)
 
         def post_init_setup():
-            # HACK: Tap into the EventBus to obtain SciJava Module debug info.
-            # See https://github.com/scijava/scijava-common/issues/452
-            event_bus_field = ij().event().getClass().getDeclaredField("eventBus")
-            event_bus_field.setAccessible(True)
-            event_bus = event_bus_field.get(ij().event())
+            # NB event subscription requires tapping into the EventBus
+            event_bus = java_event_bus()
 
             subscriber = UIShownListener()
             # NB We need to retain a reference to this object or GC will delete it
             ij().object().addObject(subscriber)
             event_bus.subscribe(jc.UIShownEvent.class_, subscriber)
 
-        java_signals.when_ij_ready(post_init_setup)
+        # NB the listener only configures UIs as they are shown; in headless
+        # mode no UI ever appears, so skip building the JPype proxy entirely.
+        if not headless:
+            java_signals.when_ij_ready(post_init_setup)
 
 
 class ToIJButton(QPushButton):
@@ -79,8 +156,7 @@ class ToIJButton(QPushButton):
         super().__init__()
         self.viewer = viewer
 
-        icon = QColoredSVGIcon.from_resources("long_right_arrow")
-        self.setIcon(icon.colored(theme=viewer.theme))
+        self.setIcon(_themed_icon("long_right_arrow", viewer.theme))
         if settings["use_active_layer"].get():
             self.setToolTip("Export active napari layer to ImageJ2")
             self.clicked.connect(self.send_active_layer)
@@ -89,8 +165,7 @@ class ToIJButton(QPushButton):
             self.clicked.connect(self.send_chosen_layer)
 
     def _set_icon(self, path: str):
-        icon: QIcon = QIcon(QPixmap(path))
-        self.setIcon(icon)
+        self.setIcon(_icon_from(path))
 
     def send_active_layer(self):
         active_layer: Optional[Layer] = self.viewer.layers.selection.active
@@ -117,13 +192,10 @@ class ToIJButton(QPushButton):
     def _show(self, layer):
         # Queue UI call on the EDT
         # TODO: Use EventQueue.invokeLater scyjava wrapper, once it exists
-        ij().thread().queue(lambda: ij().ui().show(ij().py.to_java(layer)))
+        _queue_on_edt(lambda: ij().ui().show(ij().py.to_java(layer)))
 
     def handle_no_choices(self):
-        RichTextPopup(
-            rich_message="There is no active window to export to ImageJ!",
-            exec=True,
-        )
+        _handle_no_choices("There is no active window to export to ImageJ!")
 
 
 class FromIJButton(QPushButton):
@@ -131,8 +203,7 @@ class FromIJButton(QPushButton):
         super().__init__()
         self.viewer = viewer
 
-        icon = QColoredSVGIcon.from_resources("long_left_arrow")
-        self.setIcon(icon.colored(theme=viewer.theme))
+        self.setIcon(_themed_icon("long_left_arrow", viewer.theme))
         if settings["use_active_layer"].get():
             self.setToolTip("Import active ImageJ2 Dataset to napari")
             self.clicked.connect(self.get_active_layer)
@@ -141,25 +212,30 @@ class FromIJButton(QPushButton):
             self.clicked.connect(self.get_chosen_layer)
 
     def _set_icon(self, path: str):
-        icon: QIcon = QIcon(QPixmap(path))
-        self.setIcon(icon)
-
-    def _get_objects(self, t):
-        compatibleInputs = ij().convert().getCompatibleInputs(t)
-        compatibleInputs.addAll(ij().object().getObjects(t))
-        return list(compatibleInputs)
+        self.setIcon(_icon_from(path))
+
+    def _named_objects(self, t) -> Tuple[Any, Dict[str, int]]:
+        gateway = ij()
+        object_service = gateway.object()
+        objects = gateway.convert().getCompatibleInputs(t)
+        objects.addAll(object_service.getObjects(t))
+        # Map each name to its index in the Java list; the objects
+        # themselves stay on the Java side until one is chosen.
+        names = {str(object_service.getName(o)): i for i, o in enumerate(objects)}
+        return objects, names
 
     def get_chosen_layer(self) -> None:
-        # Find all images convertible to a napari layer
-        images = self._get_objects(jc.RandomAccessibleInterval)
-        names = [ij().object().getName(i) for i in images]
+        # Find all images convertible to a napari layer, keyed by name;
+        # the chosen image is then found with one dict probe instead of a
+        # linear name search.
+        images, named_indices = self._named_objects(jc.RandomAccessibleInterval)
         # Ask the user to pick one of these images by name
         choices: dict = request_values(
             title="Send layers to napari",
-            data={"annotation": Enum, "options": {"choices": names}},
+            data={"annotation": Enum, "options": {"choices": list(named_indices)}},
         )
         if choices is None:
-            self.handle_no_choices
+            self.handle_no_choices()
         else:
             # grab the chosen name
             name = choices["data"]
@@ -169,19 +245,20 @@ class FromIJButton(QPushButton):
                 self._add_image(display.get(0))
             # Otherwise, just convert the object
             else:
-                image = images[names.index(name)]
-                self._add_image(image)
+                self._add_image(images.get(named_indices[name]))
 
     def get_active_layer(self) -> None:
         # HACK: Sync ImagePlus before transferring
         # This code can be removed once
         # https://github.com/imagej/imagej-legacy/issues/286 is solved.
-        if ij().legacy and ij().legacy.isActive():
-            current_image_plus = ij().WindowManager.getCurrentImage()
+        gateway = ij()
+        legacy = gateway.legacy
+        if legacy and legacy.isActive():
+            current_image_plus = gateway.WindowManager.getCurrentImage()
             if current_image_plus is not None:
-                ij().py.sync_image(current_image_plus)
+                gateway.py.sync_image(current_image_plus)
         # Get the active view from the active image display
-        ids = ij().get("net.imagej.display.ImageDisplayService")
+        ids = gateway.get("net.imagej.display.ImageDisplayService")
         # TODO: simplify to no-args once
         # https://github.com/imagej/imagej-legacy/pull/287 is merged.
         view = ids.getActiveDatasetView(ids.getActiveImageDisplay())
@@ -192,21 +269,19 @@ class FromIJButton(QPushButton):
 
     def _add_image(self, view: Union["jc.Dataset", "jc.DatasetView"]):
         # Get the stuff needed for a new layer
-        py_image = ij().py.from_java(view)
+        gateway = ij()
+        py_image = gateway.py.from_java(view)
         # Create and add the layer
         if isinstance(py_image, Layer):
             self.viewer.add_layer(py_image)
         elif is_arraylike(py_image):
-            name = ij().object().getName(view)
+            name = gateway.object().getName(view)
             self.viewer.add_image(data=py_image, name=name)
         else:
             raise ValueError(f"{view} cannot be displayed in napari!")
 
     def handle_no_choices(self):
-        RichTextPopup(
-            rich_message="There is no active window to export to napari!",
-            exec=True,
-        )
+        _handle_no_choices("There is no active window to export to napari!")
 
 
 class GUIButton(QPushButton):
@@ -220,8 +295,7 @@ class GUIButton(QPushButton):
             self._setup_headful()
 
     def _set_icon(self, path: str):
-        icon: QIcon = QIcon(QPixmap(path))
-        self.setIcon(icon)
+        self.setIcon(_icon_from(path))
 
         def post_setup():
             self.setEnabled(True)
@@ -258,16 +332,25 @@ class SettingsButton(QPushButton):
     # Signal used to identify changes to user settings
     setting_change = Signal()
 
+    # The names of the configurable settings, in config-default.yaml order.
+    # Computed on the first popup and reused - the default source never
+    # changes at runtime - while the VALUES shown stay live, fetched per
+    # click in _register_setting_param.
+    _setting_names: Optional[tuple] = None
+
     def __init__(self, viewer: Viewer):
         super().__init__()
         self.viewer = viewer
 
-        icon = QColoredSVGIcon(resource_path("gear"))
-        self.setIcon(icon.colored(theme=viewer.theme))
+        self.setIcon(_themed_resource_icon(resource_path("gear"), viewer.theme))
 
         self.clicked.connect(self._update_settings)
         self.setting_change.connect(self._notify_settings_change)
-        self.setting_change.connect(self._write_settings)
+
+        # Coalesces rapid successive setting changes into a single file write
+        self._write_timer = QTimer(self)
+        self._write_timer.setSingleShot(True)
+        self._write_timer.timeout.connect(self._flush_settings)
 
     def _update_settings(self):
         """
@@ -280,12 +363,14 @@ class SettingsButton(QPushButton):
         # config-default.yaml. Secondly, it ensures that tampering with any user
         # setting files does not add settings to this popup that don't exist in
         # the default file
-        default_source = next((s for s in settings.sources if s.default), None)
-        if not default_source:
-            raise ValueError(
-                "napari-imagej settings does not contain a default source!"
-            )
-        for setting in default_source:
+        if SettingsButton._setting_names is None:
+            default_source = next((s for s in settings.sources if s.default), None)
+            if not default_source:
+                raise ValueError(
+                    "napari-imagej settings does not contain a default source!"
+                )
+            SettingsButton._setting_names = tuple(default_source)
+        for setting in SettingsButton._setting_names:
             self._register_setting_param(args, setting)
         # Use magicgui.request_values to allow user to configure settings
         choices = request_values(title="napari-imagej Settings", values=args)
@@ -296,6 +381,11 @@ class SettingsButton(QPushButton):
                 any_changed |= self._apply_setting_param(setting, value)
 
             if any_changed:
+                # Schedule the write BEFORE notifying: scheduling only starts
+                # a timer, and the flush then runs while the (modal)
+                # notification popup spins the event loop, keeping file I/O
+                # off the critical path.
+                self._write_settings()
                 self.setting_change.emit()
 
     def _register_setting_param(self, args: Dict[Any, Any], setting: str):
@@ -318,6 +408,10 @@ class SettingsButton(QPushButton):
         if isinstance(value, Path):
             value = str(value)
 
+        # Unchanged values need no validation and no assignment
+        if settings[setting].get() == value:
+            return False
+
         # Then, validate the new value
         try:
             settings._validate_setting(setting, value)
@@ -333,13 +427,9 @@ class SettingsButton(QPushButton):
             )
             return False
 
-        # Record the old value
-        original = settings[setting].get()
         # Set the new value
         settings[setting] = value
-
-        # Report a change in value
-        return original != value
+        return True
 
     def _notify_settings_change(self):
         """
@@ -353,6 +443,14 @@ class SettingsButton(QPushButton):
         )
 
     def _write_settings(self):
+        """
+        Schedules a write of the settings to the local configuration YAML file.
+
+        Changes made within one event-loop turn share a single write.
+        """
+        self._write_timer.start(0)
+
+    def _flush_settings(self):
         """
         Writes settings to a local configuration YAML file
         """
@@ -382,7 +480,8 @@ class UIShownListener(object):
     def onEvent(self, event):
         if not self.initialized:
             # add our custom settings to the User Interface
-            if ij().legacy and ij().legacy.isActive():
+            legacy = ij().legacy
+            if legacy and legacy.isActive():
                 self._ij1_UI_setup()
             self._ij2_UI_setup(event.getUI())
             self.initialized = True
@@ -418,37 +517,43 @@ class UIShownListener(object):
             window.removeWindowListener(listener)
 
         # Add our own behavior for WindowEvents
-        @JImplements("java.awt.event.WindowListener")
-        class NapariAdapter(object):
-            @JOverride
-            def windowOpened(self, event):
-                pass
-
-            @JOverride
-            def windowClosing(self, event):
-                # We don't want to shut down anything, we just want to hide the window.
-                window.setVisible(False)
-
-            @JOverride
-            def windowClosed(self, event):
-                pass
-
-            @JOverride
-            def windowIconified(self, event):
-                pass
-
-            @JOverride
-            def windowDeiconified(self, event):
-                pass
-
-            @JOverride
-            def windowActivated(self, event):
-                pass
-
-            @JOverride
-            def windowDeactivated(self, event):
-                pass
-
-        listener = NapariAdapter()
+        listener = NapariAdapter(window)
         ij().object().addObject(listener)
         window.addWindowListener(listener)
+
+
+@JImplements("java.awt.event.WindowListener", deferred=True)
+class NapariAdapter(object):
+    """A WindowListener hiding (not closing) a window when it is closed"""
+
+    def __init__(self, window):
+        self.window = window
+
+    @JOverride
+    def windowOpened(self, event):
+        pass
+
+    @JOverride
+    def windowClosing(self, event):
+        # We don't want to shut down anything, we just want to hide the window.
+        self.window.setVisible(False)
+
+    @JOverride
+    def windowClosed(self, event):
+        pass
+
+    @JOverride
+    def windowIconified(self, event):
+        pass
+
+    @JOverride
+    def windowDeiconified(self, event):
+        pass
+
+    @JOverride
+    def windowActivated(self, event):
+        pass
+
+    @JOverride
+    def windowDeactivated(self, event):
+        pass
@@ -27,6 +27,7 @@ from napari_imagej.widgets.result_tree import (
     SearchResultTreeItem,
 )
 from napari_imagej.widgets.searchbar import JVMEnabledSearchbar
+from napari_imagej.widgets.widget_utils import java_event_bus
 
 
 class NapariImageJWidget(QWidget):
@@ -217,9 +218,8 @@ class WidgetFinalizer(QThread):
         listener_arr = JArray(jc.SearchListener)(
             [NapariImageJSearchListener(self.widget.result_tree.process)]
         )
-        self.widget.result_tree._searchOperation = (
-            ij().get("org.scijava.search.SearchService").search(listener_arr)
-        )
+        search_service = ij().get("org.scijava.search.SearchService")
+        self.widget.result_tree._searchOperation = search_service.search(listener_arr)
         # Make sure that the search stops when we close napari
         # Otherwise the Java threads like to continue
         when_jvm_stops(self.widget.result_tree._searchOperation.terminate)
@@ -230,20 +230,15 @@ class WidgetFinalizer(QThread):
             self.widget.result_tree.insert.emit(
                 SearcherTreeItem(
                     searcher,
-                    checked=ij()
-                    .get("org.scijava.search.SearchService")
-                    .enabled(searcher),
+                    checked=search_service.enabled(searcher),
                     expanded=False,
                 )
             )
 
     def _finalize_info_bar(self):
         self.widget.info_box.version_bar.setText(f"ImageJ2 v{ij().getVersion()}")
-        # HACK: Tap into the EventBus to obtain SciJava Module debug info.
-        # See https://github.com/scijava/scijava-common/issues/452
-        event_bus_field = ij().event().getClass().getDeclaredField("eventBus")
-        event_bus_field.setAccessible(True)
-        event_bus = event_bus_field.get(ij().event())
+        # NB event subscription requires tapping into the EventBus
+        event_bus = java_event_bus()
 
         progress_listener = ProgressBarListener(self.widget.progress_handler)
         # NB We need to retain a reference to this object or GC will delete it
@@ -252,11 +247,8 @@ class WidgetFinalizer(QThread):
         event_bus.subscribe(jc.ModuleEvent.class_, progress_listener)
 
     def _finalize_exception_printer(self):
-        # HACK: Tap into the EventBus to obtain SciJava Module debug info.
-        # See https://github.com/scijava/scijava-common/issues/452
-        event_bus_field = ij().event().getClass().getDeclaredField("eventBus")
-        event_bus_field.setAccessible(True)
-        event_bus = event_bus_field.get(ij().event())
+        # NB event subscription requires tapping into the EventBus
+        event_bus = java_event_bus()
 
         subscriber = NapariEventSubscriber()
         # NB We need to retain a reference to this object or GC will delete it
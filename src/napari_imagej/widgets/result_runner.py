@@ -79,14 +79,16 @@ class ResultRunner(QWidget):
         Using SHIFT, the second-highest action is run.
         :param result: The selected SearchResult
         """
-        buttons: List[ActionButton] = self._buttons_for(result)
+        # NB we invoke the actions directly; there's no need to wrap them
+        # in never-shown ActionButtons just to run one of them.
+        actions = python_actions_for(result, self.output_signal, self)
         # Run the first action UNLESS Shift is also pressed.
         # If so, run the second action
-        if len(buttons) > 0:
-            if len(buttons) > 1 and QApplication.keyboardModifiers() & Qt.ShiftModifier:
-                buttons[1].action()
+        if len(actions) > 0:
+            if len(actions) > 1 and QApplication.keyboardModifiers() & Qt.ShiftModifier:
+                actions[1][1]()
             else:
-                buttons[0].action()
+                actions[0][1]()
 
     # -- HELPER FUNCTIONALITY -- #
 
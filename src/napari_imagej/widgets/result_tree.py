@@ -5,7 +5,7 @@ SearchResults are grouped by the SciJava Searcher that created them.
 """
 from typing import List, Optional
 
-from qtpy.QtCore import Qt, Signal, Slot
+from qtpy.QtCore import Qt, QTimer, Signal, Slot
 from qtpy.QtWidgets import QAction, QMenu, QTreeWidget, QTreeWidgetItem
 from scyjava import Priority
 
@@ -53,7 +53,7 @@ class SearcherTreeItem(QTreeWidgetItem):
         :param expanded: Indicates whether this SearcherTreeItem should start expanded
         """
         super().__init__()
-        self.title = ij().py.from_java(searcher.title())
+        self.title = str(searcher.title())
         self._searcher = searcher
         # Finding the priority is tricky - Searchers don't know their priority
         # To find it we have to ask the pluginService.
@@ -120,8 +120,23 @@ class SearchResultTree(QTreeWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._create_custom_menu)
 
+        # Debounce searches - each search kicks off work in every enabled
+        # Searcher, so we wait for a brief pause in typing before launching
+        # one search for the latest text.
+        self._pending_search: Optional[str] = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._run_pending_search)
+
     def search(self, text: str):
-        self._searchOperation.search(text)
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _run_pending_search(self):
+        if self._pending_search is not None:
+            self._searchOperation.search(self._pending_search)
+            self._pending_search = None
 
     @Slot(SearcherTreeItem)
     def _add_searcher_tree_item(self, item: SearcherTreeItem):
@@ -142,7 +157,13 @@ class SearchResultTree(QTreeWidget):
         header = self._get_matching_item(event.searcher())
         result_items = self._generate_result_items(event)
         if header:
-            header.update(result_items)
+            # Suppress repaints while the children are swapped out;
+            # one repaint at the end replaces one per item mutation.
+            self.setUpdatesEnabled(False)
+            try:
+                header.update(result_items)
+            finally:
+                self.setUpdatesEnabled(True)
         else:
             log_debug(f"Searcher {event.searcher()} not found!")
 
@@ -209,7 +230,7 @@ class SearchResultTree(QTreeWidget):
                     item.update([])
 
     def _get_matching_item(self, searcher: "jc.Searcher") -> Optional[SearcherTreeItem]:
-        name: str = ij().py.from_java(searcher.title())
+        name: str = str(searcher.title())
         matches = self.findItems(name, Qt.MatchStartsWith, 0)
         if len(matches) == 0:
             return None
@@ -231,4 +252,4 @@ class SearchResultTree(QTreeWidget):
             if str(results[0].name()) == "<error>":
                 log_debug(f"Failed Search: {str(results[0].properties().get(None))}")
                 return []
-        return [SearchResultTreeItem(r) for r in event.results()]
+        return [SearchResultTreeItem(r) for r in results]
@@ -10,6 +10,25 @@ from napari_imagej.utilities._module_utils import (
 )
 from napari_imagej.utilities.logging import log_debug
 
+# The reflected (and accessibility-bypassed) EventBus field, resolved once
+_event_bus_field = None
+
+
+def java_event_bus():
+    """
+    HACK: Taps into the EventBus of the SciJava EventService, so that
+    subscribers can be registered for any event type.
+    See https://github.com/scijava/scijava-common/issues/452
+    :return: the EventBus backing the SciJava EventService
+    """
+    global _event_bus_field
+    event_service = ij().event()
+    if _event_bus_field is None:
+        field = event_service.getClass().getDeclaredField("eventBus")
+        field.setAccessible(True)
+        _event_bus_field = field
+    return _event_bus_field.get(event_service)
+
 
 def python_actions_for(
     result: "jc.SearchResult", output_signal: Signal, parent_widget: QWidget = None
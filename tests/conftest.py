@@ -2,6 +2,7 @@
 A module containing pytest configuration and globally-used fixtures
 """
 import os
+from pathlib import Path
 from typing import Callable, Generator
 
 import pytest
@@ -32,11 +33,21 @@ def asserter(qtbot) -> Callable[[Callable[[], bool]], None]:
     return assertFunc
 
 
-@pytest.fixture(autouse=True)
-def install_default_settings():
-    """Fixture ensuring any changes made earlier to the settings are reversed"""
+@pytest.fixture(scope="session")
+def _default_settings_sources():
+    """Fixture parsing the default settings ONCE for the entire session"""
     napari_imagej.settings.clear()
     napari_imagej.settings.read()
+    return list(napari_imagej.settings.sources)
+
+
+@pytest.fixture(autouse=True)
+def install_default_settings(_default_settings_sources):
+    """Fixture ensuring any changes made earlier to the settings are reversed"""
+    # Any setting assignment stacks an overlay source atop the parsed ones,
+    # so restoring the parsed sources undoes all changes without re-reading
+    # (and re-parsing) the settings YAML from disk for every test.
+    napari_imagej.settings.sources[:] = _default_settings_sources
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -47,15 +58,16 @@ def preserve_user_settings():
 
     if os.path.exists(user_path):
         # If they existed, read in the settings and delete the file
-        with open(user_path, "r") as f:
-            existing_settings = f.read()
+        existing_settings = Path(user_path).read_bytes()
         os.remove(user_path)
 
         yield
 
-        # After the test, restore the file
-        with open(user_path, "w") as f:
-            f.write(existing_settings)
+        # After the test, restore the file. Write to a sibling and swap it
+        # into place, so the restored file appears atomically.
+        restore_path = Path(user_path + ".restore")
+        restore_path.write_bytes(existing_settings)
+        os.replace(restore_path, user_path)
     else:
         yield
 
@@ -78,7 +90,10 @@ def ij():
 
     yield ij()
 
-    ij().context().dispose()
+    # Disposing the SciJava Context takes seconds; the JVM dies with the
+    # test process anyway, so only dispose when explicitly requested.
+    if os.environ.get("NAPARI_IMAGEJ_TEST_DISPOSE", "no") == "yes":
+        ij().context().dispose()
 
 
 @pytest.fixture()